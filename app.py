@@ -1,17 +1,20 @@
 import sys
 import math
-import time
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QGraphicsView, QGraphicsScene, 
                             QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                             QCheckBox, QSlider, QRadioButton, QButtonGroup, QFrame, 
-                            QSplitter, QGroupBox, QTextEdit)
+                            QSplitter, QGroupBox, QTextEdit, QGraphicsItem)
 from PyQt5.QtGui import (QPen, QBrush, QColor, QPainter, QPainterPath, QFont, 
                          QLinearGradient, QRadialGradient, QPolygonF, QTransform,
                          QPalette)
-from PyQt5.QtCore import Qt, QPointF, QRectF, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, QPointF, QRectF, QLineF, QTimer, QElapsedTimer, QPropertyAnimation, QEasingCurve
 
-from geometry import convex_hull, hull_edges, intersection_point
+import numpy as np
+
+from geometry import (collisions_against_hull, hull_edge_arrays, hull_insert, in_convex_hull,
+                      point_segment_sq_distances)
 
 Point = Tuple[float, float]
 
@@ -28,6 +31,7 @@ class CollisionGraphicsScene(QGraphicsScene):
         self.grid_size = 40
         self.grid_color = QColor(45, 45, 55)
         self.grid_major_color = QColor(60, 60, 70)
+        self._update_grid_pens()
         
         # Visual settings
         self.hull_brush = QBrush(QColor(50, 100, 240, 50))
@@ -59,6 +63,12 @@ class CollisionGraphicsScene(QGraphicsScene):
             self.obstacle_brush = QBrush(QColor(70, 80, 100))
             
         self.hull_pen.setCosmetic(True)
+        self._update_grid_pens()
+        
+    def _update_grid_pens(self):
+        """Rebuild the grid pens after the grid colors change"""
+        self.grid_pen = QPen(self.grid_color, 1)
+        self.grid_major_pen = QPen(self.grid_major_color, 1)
         
     def drawBackground(self, painter: QPainter, rect: QRectF):
         """Draw a professional grid background with subtle gradients"""
@@ -67,8 +77,10 @@ class CollisionGraphicsScene(QGraphicsScene):
         if not self.grid_visible:
             return
             
-        # Draw terrain-like background with subtle gradient
-        gradient = QLinearGradient(0, 0, 0, rect.height())
+        # Draw terrain-like background with subtle gradient, anchored to the
+        # scene rect so partial viewport updates blend seamlessly
+        scene_rect = self.sceneRect()
+        gradient = QLinearGradient(0, scene_rect.top(), 0, scene_rect.bottom())
         background_color = self.backgroundBrush().color()
         slightly_darker = QColor(
             max(0, background_color.red() - 5),
@@ -83,19 +95,25 @@ class CollisionGraphicsScene(QGraphicsScene):
         left = int(rect.left()) - (int(rect.left()) % self.grid_size)
         top = int(rect.top()) - (int(rect.top()) % self.grid_size)
         
+        # Grid lines are axis-aligned, so antialiasing only costs fill time
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        
         # Draw minor grid lines
-        painter.setPen(QPen(self.grid_color, 1))
-        for x in range(left, int(rect.right()), self.grid_size):
-            painter.drawLine(x, rect.top(), x, rect.bottom())
-        for y in range(top, int(rect.bottom()), self.grid_size):
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        painter.setPen(self.grid_pen)
+        painter.drawLines(self._grid_lines(rect, left, top, self.grid_size))
             
         # Draw major grid lines
-        painter.setPen(QPen(self.grid_major_color, 1))
-        for x in range(left, int(rect.right()), self.grid_size * 5):
-            painter.drawLine(x, rect.top(), x, rect.bottom())
-        for y in range(top, int(rect.bottom()), self.grid_size * 5):
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        painter.setPen(self.grid_major_pen)
+        painter.drawLines(self._grid_lines(rect, left, top, self.grid_size * 5))
+        painter.restore()
+        
+    @staticmethod
+    def _grid_lines(rect: QRectF, left: int, top: int, step: int) -> List[QLineF]:
+        """Build the grid lines covering rect so they can be drawn in one call"""
+        lines = [QLineF(x, rect.top(), x, rect.bottom()) for x in range(left, int(rect.right()), step)]
+        lines.extend(QLineF(rect.left(), y, rect.right(), y) for y in range(top, int(rect.bottom()), step))
+        return lines
 
 
 class CollisionDetectorApp(QMainWindow):
@@ -105,22 +123,35 @@ class CollisionDetectorApp(QMainWindow):
         self.resize(1200, 700)
         
         # Data structures
-        self.points: List[Point] = []
-        self.hull: List[Point] = []
+        # Obstacle points live in a growable (capacity, 2) buffer; the hull is
+        # kept as indices into it plus a cached (h, 2) copy of its vertices
+        self._points_xy = np.empty((64, 2), dtype=np.float64)
+        self._n_points = 0
+        self._hull_rev = 0  # bumped whenever the hull changes
+        self._set_hull(np.empty(0, dtype=np.intp))
         self.path_start: Optional[Point] = None
         self.path_end: Optional[Point] = None
-        self.collisions: List[Point] = []
+        self._path_cache: Tuple[float, ...] = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        self.collisions: List[Point] = []  # kept sorted by (x, y)
+        self._collision_key: Optional[tuple] = None  # inputs of the last collision update
         
         # Simulation state
         self.car_t: float = 0.0  # param along path [0,1]
         self.anim_running: bool = False
-        self._last_ts: Optional[float] = None
+        self._info_key: Optional[tuple] = None  # inputs of the last info panel render
+        self._info_car_line: Optional[str] = None
+        self._info_dirty = False  # a refresh was skipped while the panel was collapsed
         self.first_collision_t: Optional[float] = None
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setTimerType(Qt.PreciseTimer)
+        self._anim_timer.setInterval(16)  # ~60 FPS
+        self._anim_clock = QElapsedTimer()  # time since the previous tick
+        self._anim_timer.timeout.connect(self._tick)
         self.mode = "obstacle"  # "obstacle", "start", "end"
         
         # Car path trail
-        self.trail_points: List[Point] = []
         self.trail_max_points = 30
+        self.trail_points: Deque[Point] = deque(maxlen=self.trail_max_points)
         self.show_motion_trail = True
         
         # Theme state
@@ -155,11 +186,16 @@ class CollisionDetectorApp(QMainWindow):
         view_layout.setContentsMargins(0, 0, 0, 0)
         
         self.scene = CollisionGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.view = QGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.NoDrag)
-        self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Only repaint the regions items actually touch (mostly the car and trail)
+        self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        # The gradient and grid only change with the theme or grid toggle, so
+        # paint them once into a pixmap instead of on every car-sized repaint
+        self.view.setCacheMode(QGraphicsView.CacheBackground)
         self.view.setBackgroundBrush(QBrush(QColor(25, 25, 35)))
         
         view_layout.addWidget(self.view)
@@ -304,6 +340,7 @@ class CollisionDetectorApp(QMainWindow):
         
         # Init the scene
         self.scene.setSceneRect(0, 0, 800, 600)
+        self._init_scene_items()
         self._redraw()
         
     def _connect_signals(self):
@@ -326,10 +363,19 @@ class CollisionDetectorApp(QMainWindow):
         self.speed_slider.valueChanged.connect(self._update_speed)
         self.tolerance_slider.valueChanged.connect(self._update_tolerance)
         
+        # Collapse bursts of tolerance changes during a drag into one update
+        self._tol_timer = QTimer(self)
+        self._tol_timer.setSingleShot(True)
+        self._tol_timer.setInterval(30)
+        self._tol_timer.timeout.connect(self._apply_tolerance)
+        
         # Options
         self.show_grid.stateChanged.connect(self._toggle_grid)
         self.show_trail.stateChanged.connect(self._toggle_trail)
         
+        # Refresh the info panel if it was skipped while collapsed
+        self.splitter.splitterMoved.connect(self._on_splitter_moved)
+        
         # Mouse click in view
         self.view.mousePressEvent = self._handle_view_click
         
@@ -352,13 +398,22 @@ class CollisionDetectorApp(QMainWindow):
         """Update hit tolerance"""
         self.hit_tol = value / 10.0
         self.tolerance_value.setText(f"{self.hit_tol} px")
+        self._tol_timer.start()
+        
+    def _apply_tolerance(self):
+        """Recompute collisions once the tolerance slider settles"""
         self._update_collisions()
         self._redraw()
         
+    def _on_splitter_moved(self, pos, index):
+        """Bring the info panel up to date once it is visible again"""
+        if self._info_dirty:
+            self._refresh_info()
+            
     def _toggle_grid(self, state):
         """Toggle grid visibility"""
         self.scene.grid_visible = (state == Qt.Checked)
-        self.view.viewport().update()
+        self.view.resetCachedContent()
         
     def _toggle_trail(self, state):
         """Toggle motion trail visibility"""
@@ -423,7 +478,7 @@ class CollisionDetectorApp(QMainWindow):
         
         # Update scene colors
         self.scene.setDarkMode(self.dark_mode)
-        self.view.viewport().update()
+        self.view.resetCachedContent()
         
         # Redraw with new theme colors
         self._redraw()
@@ -435,13 +490,14 @@ class CollisionDetectorApp(QMainWindow):
         pt = (scene_pos.x(), scene_pos.y())
         
         if self.mode == "obstacle":
-            self.points.append(pt)
-            self.hull = convex_hull(self.points)
+            self._add_point(pt)
         elif self.mode == "start":
             self.path_start = pt
+            self._refresh_path_cache()
             self._reset_animation()
         elif self.mode == "end":
             self.path_end = pt
+            self._refresh_path_cache()
             self._reset_animation()
             
         self._update_collisions()
@@ -451,33 +507,63 @@ class CollisionDetectorApp(QMainWindow):
         # Call the parent class's mousePressEvent
         super(QGraphicsView, self.view).mousePressEvent(event)
         
+    @property
+    def points(self) -> np.ndarray:
+        """Obstacle points as an (n, 2) view of the point buffer"""
+        return self._points_xy[:self._n_points]
+        
+    def _add_point(self, pt: Point):
+        """Append an obstacle point and update the hull incrementally"""
+        if self._n_points == len(self._points_xy):
+            # Grow geometrically so appends stay amortized O(1)
+            grown = np.empty((2 * len(self._points_xy), 2), dtype=np.float64)
+            grown[:self._n_points] = self.points
+            self._points_xy = grown
+        self._points_xy[self._n_points] = pt
+        hull_idx = hull_insert(self._points_xy, self._hull_idx, self._n_points)
+        self._n_points += 1
+        if hull_idx is not self._hull_idx:
+            self._set_hull(hull_idx)
+            
+    def _set_hull(self, hull_idx: np.ndarray):
+        """Install a new hull and refresh everything derived from it"""
+        self._hull_idx = hull_idx
+        self.hull = self._points_xy[hull_idx]
+        self._hull_pts: List[Point] = [tuple(p) for p in self.hull.tolist()]
+        self._edges_a, self._edges_b = hull_edge_arrays(self.hull)
+        self._hull_bbox: Tuple[float, float, float, float] = (
+            (*self.hull.min(axis=0).tolist(), *self.hull.max(axis=0).tolist())
+            if len(hull_idx) else (math.inf, math.inf, -math.inf, -math.inf)
+        )
+        self._hull_rev += 1
+        
     def _update_collisions(self):
         """Detect collisions between path and hull"""
+        # Skip the work when hull, path and tolerance are unchanged
+        key = (self._hull_rev, self.path_start, self.path_end, self.hit_tol)
+        if key == self._collision_key:
+            return
+        self._collision_key = key
+        
         self.collisions.clear()
         self.first_collision_t = None
         
         if not self.path_start or not self.path_end:
             return
             
-        path_segment = (self.path_start, self.path_end)
-        
-        # Check for intersections with hull edges
-        for edge in hull_edges(self.hull):
-            pt = intersection_point(path_segment, edge)
-            if pt:
-                if not any((abs(pt[0] - q[0]) < 1e-6 and abs(pt[1] - q[1]) < 1e-6) for q in self.collisions):
-                    self.collisions.append(pt)
-                    
-        # Check endpoints with tolerance
-        tol = self.hit_tol
-        for edge in hull_edges(self.hull):
-            for endpoint in (self.path_start, self.path_end):
-                if self._point_on_segment(edge[0], edge[1], endpoint, tol):
-                    if not any((abs(endpoint[0] - q[0]) < 1e-6 and abs(endpoint[1] - q[1]) < 1e-6) for q in self.collisions):
-                        self.collisions.append(endpoint)
-                        
-        # Find first collision
-        self.first_collision_t = self._compute_first_collision_t(self.collisions)
+        # Check hull edges against the path and its endpoints (with tolerance)
+        hits, hit_t = collisions_against_hull(
+            self._edges_a,
+            self._edges_b,
+            np.array(self.path_start, dtype=np.float64),
+            np.array(self.path_end, dtype=np.float64),
+            self.hit_tol,
+        )
+        self.collisions = sorted(map(tuple, hits.tolist()))
+        
+        # Find first collision (undefined on a zero-length path)
+        if len(hit_t) and self._path_length() > 1e-6:
+            self.first_collision_t = float(hit_t.min())
         
         # Update collision status indicator
         if self.collisions:
@@ -487,130 +573,80 @@ class CollisionDetectorApp(QMainWindow):
             self.collision_status.setText("No collision")
             self.collision_status.setStyleSheet("color: green; font-weight: bold;")
             
-    def _redraw(self):
-        """Redraw the entire scene"""
-        self.scene.clear()
-        
-        # Draw hull
-        if len(self.hull) >= 3:
-            hull_polygon = QPolygonF()
-            for x, y in self.hull:
-                hull_polygon.append(QPointF(x, y))
-            hull_item = self.scene.addPolygon(hull_polygon, self.scene.hull_pen, self.scene.hull_brush)
-            hull_item.setZValue(10)
-        elif len(self.hull) == 2:
-            p1, p2 = self.hull
-            self.scene.addLine(p1[0], p1[1], p2[0], p2[1], self.scene.hull_pen)
-            
-        # Draw obstacle points
-        for x, y in self.points:
-            point_item = self.scene.addEllipse(x-4, y-4, 8, 8, QPen(Qt.NoPen), self.scene.obstacle_brush)
-            point_item.setZValue(20)
-            
-        # Draw path
-        if self.path_start and self.path_end:
-            # Draw path line
-            path_item = self.scene.addLine(
-                self.path_start[0], self.path_start[1],
-                self.path_end[0], self.path_end[1],
-                self.scene.path_pen
-            )
-            path_item.setZValue(30)
-            
-            # Draw endpoints
-            start_item = self.scene.addEllipse(
-                self.path_start[0]-5, self.path_start[1]-5, 10, 10, 
-                QPen(QColor(40, 200, 90), 1.5), QBrush(Qt.NoBrush)
-            )
-            start_item.setZValue(31)
-            
-            end_item = self.scene.addEllipse(
-                self.path_end[0]-5, self.path_end[1]-5, 10, 10, 
-                QPen(QColor(40, 200, 90), 1.5), QBrush(Qt.NoBrush)
-            )
-            end_item.setZValue(31)
-            
-            # Draw motion trail if enabled
-            if self.show_motion_trail and self.trail_points:
-                for i, (x, y) in enumerate(self.trail_points):
-                    alpha = int(160 * (i / len(self.trail_points)))
-                    trail_brush = QBrush(QColor(40, 180, 100, alpha))
-                    trail_size = 3 + 4 * (i / len(self.trail_points))
-                    trail_item = self.scene.addEllipse(
-                        x - trail_size/2, y - trail_size/2, 
-                        trail_size, trail_size, 
-                        QPen(Qt.NoPen), trail_brush
-                    )
-                    trail_item.setZValue(35)
-                    
-            # Draw car
-            self._draw_car()
-            
-        # Draw collisions
-        for x, y in self.collisions:
-            collision_item = self.scene.addEllipse(x-7, y-7, 14, 14, self.scene.collision_pen, QBrush(Qt.NoBrush))
-            collision_item.setZValue(40)
-            
-        # Highlight first collision
-        if self.first_collision_t is not None and self.path_start and self.path_end:
-            cx, cy = self._point_at_t(self.first_collision_t)
-            first_collision = self.scene.addEllipse(
-                cx-8, cy-8, 16, 16, 
-                QPen(QColor(185, 28, 28), 3), QBrush(Qt.NoBrush)
+    def _init_scene_items(self):
+        """Create the persistent scene items that _redraw updates in place"""
+        self._no_pen = no_pen = QPen(Qt.NoPen)
+        self._no_brush = no_brush = QBrush(Qt.NoBrush)
+        endpoint_pen = QPen(QColor(40, 200, 90), 1.5)
+        
+        # Hull: polygon for 3+ vertices, line for 2
+        self._hull_item = self.scene.addPolygon(QPolygonF(), self.scene.hull_pen, self.scene.hull_brush)
+        self._hull_item.setZValue(10)
+        self._hull_line_item = self.scene.addLine(0, 0, 0, 0, self.scene.hull_pen)
+        self._hull_line_item.setZValue(10)
+        
+        # All obstacle points share one path item
+        self._dots_item = self.scene.addPath(QPainterPath(), no_pen, self.scene.obstacle_brush)
+        self._dots_item.setZValue(20)
+        self._dots_count = 0
+        
+        # Collision markers are pooled and grown on demand
+        self._collision_items = []
+        
+        # Path line and endpoints
+        self._path_item = self.scene.addLine(0, 0, 0, 0, self.scene.path_pen)
+        self._path_item.setZValue(30)
+        self._start_item = self.scene.addEllipse(-5, -5, 10, 10, endpoint_pen, no_brush)
+        self._start_item.setZValue(31)
+        self._end_item = self.scene.addEllipse(-5, -5, 10, 10, endpoint_pen, no_brush)
+        self._end_item.setZValue(31)
+        
+        # Motion trail pool, one item per trail slot; older slots are smaller
+        # and fainter, so size and colour are fixed when the item is created
+        self._trail_items = []
+        n = self.trail_max_points
+        for i in range(n):
+            trail_size = 3 + 4 * (i / n)
+            trail_item = self.scene.addEllipse(
+                -trail_size/2, -trail_size/2, trail_size, trail_size,
+                no_pen, QBrush(QColor(40, 180, 100, int(160 * (i / n))))
             )
-            first_collision.setZValue(50)
-            
-            # Add a pulsing effect
-            if self.anim_running and self.car_t >= self.first_collision_t:
-                glow = self.scene.addEllipse(
-                    cx-15, cy-15, 30, 30,
-                    QPen(QColor(220, 38, 38, 100), 2), 
-                    QBrush(QColor(220, 38, 38, 30))
-                )
-                glow.setZValue(45)
-            
-    def _draw_car(self):
-        """Draw a more detailed car at the current position"""
-        if not self.path_start or not self.path_end:
-            return
+            trail_item.setZValue(35)
+            self._trail_items.append(trail_item)
             
-        pos = self._point_at_t(self.car_t)
-        dx, dy = self._path_vector()
-        if dx == 0 and dy == 0:
-            return
-            
-        # Calculate car orientation
-        ang = math.atan2(dy, dx)
-        
-        # Check if car is in collision state
-        in_collision = (self.first_collision_t is not None and 
-                       self.car_t >= self.first_collision_t - 1e-6)
-        
-        # Car body with wheels
-        car_group = self.scene.createItemGroup([])
-        car_group.setZValue(60)
+        # First collision highlight and its pulsing glow
+        self._first_collision_item = self.scene.addEllipse(
+            -8, -8, 16, 16,
+            QPen(QColor(185, 28, 28), 3), no_brush
+        )
+        self._first_collision_item.setZValue(50)
+        self._glow_item = self.scene.addEllipse(
+            -15, -15, 30, 30,
+            QPen(QColor(220, 38, 38, 100), 2),
+            QBrush(QColor(220, 38, 38, 30))
+        )
+        self._glow_item.setZValue(45)
         
-        # Add to trail
-        self.trail_points.append(pos)
-        if len(self.trail_points) > self.trail_max_points:
-            self.trail_points.pop(0)
+        self._init_car_items()
         
-        # Create car body
+    def _init_car_items(self):
+        """Build the car once in local space; _draw_car only moves and turns it"""
         length, width = 18.0, 10.0
+        no_pen = self._no_pen
         
-        # Car color changes on collision
-        body_color = QColor(200, 40, 40) if in_collision else QColor(15, 118, 110)
-        wheel_color = QColor(30, 30, 30)
+        # Normal and in-collision brushes, swapped by _draw_car
+        self._car_body_brush = QBrush(QColor(15, 118, 110))
+        self._car_body_hit_brush = QBrush(QColor(200, 40, 40))
+        self._windshield_brush = QBrush(QColor(150, 230, 255))
+        self._windshield_hit_brush = QBrush(QColor(255, 200, 200))
         
-        # Create a car shape as a path
-        car_path = QPainterPath()
+        self._car_group = self.scene.createItemGroup([])
+        self._car_group.setZValue(60)
         
         # Car body points (designed in local space)
-        nose_x, nose_y = length/2, 0
-        rear_x, rear_y = -length/2, 0
-        left_x, left_y = 0, width/2
-        right_x, right_y = 0, -width/2
+        nose_x = length/2
         
+        car_path = QPainterPath()
         car_path.moveTo(nose_x, 0)  # nose
         car_path.quadTo(nose_x-length/4, -width/2, 0, -width/2)  # right curve
         car_path.lineTo(-length/3, -width/2)  # right side
@@ -619,79 +655,186 @@ class CollisionDetectorApp(QMainWindow):
         car_path.lineTo(0, width/2)  # left side
         car_path.quadTo(nose_x-length/4, width/2, nose_x, 0)  # left curve to nose
         
-        # Transform car to world space
-        transform = QTransform()
-        transform.translate(pos[0], pos[1])
-        transform.rotate(math.degrees(ang))
+        self._car_body_item = self.scene.addPath(car_path, QPen(QColor(0, 0, 0)), self._car_body_brush)
+        self._car_group.addToGroup(self._car_body_item)
         
-        car_path = transform.map(car_path)
+        # Highlight/shadow for 3D effect (hidden while colliding)
+        highlight_path = QPainterPath()
+        highlight_path.moveTo(nose_x, 0)
+        highlight_path.quadTo(nose_x-length/4, -width/4, 0, -width/3)
+        highlight_path.lineTo(0, -width/5)
+        highlight_path.quadTo(nose_x-length/4, -width/6, nose_x-width/3, 0)
         
-        # Add car body
-        car_item = self.scene.addPath(car_path, QPen(QColor(0, 0, 0)), QBrush(body_color))
-        car_group.addToGroup(car_item)
+        self._car_highlight_item = self.scene.addPath(highlight_path, no_pen, QBrush(QColor(30, 150, 140)))
+        self._car_group.addToGroup(self._car_highlight_item)
         
-        # Add highlight/shadow for 3D effect
-        if not in_collision:
-            highlight_path = QPainterPath()
-            highlight_path.moveTo(nose_x, 0)
-            highlight_path.quadTo(nose_x-length/4, -width/4, 0, -width/3)
-            highlight_path.lineTo(0, -width/5)
-            highlight_path.quadTo(nose_x-length/4, -width/6, nose_x-width/3, 0)
-            highlight_path = transform.map(highlight_path)
-            
-            highlight = self.scene.addPath(highlight_path, QPen(Qt.NoPen), QBrush(QColor(30, 150, 140)))
-            car_group.addToGroup(highlight)
-            
-        # Add wheels - just small black circles
+        # Wheels - just small black circles
+        wheel_brush = QBrush(QColor(30, 30, 30))
         wheel_size = 4.0
         wheel_offset_x = length/3
         wheel_offset_y = width/2 + wheel_size/4
-        
-        # Transform wheel positions
-        fl_wheel_pos = transform.map(QPointF(wheel_offset_x, -wheel_offset_y))
-        fr_wheel_pos = transform.map(QPointF(wheel_offset_x, wheel_offset_y))
-        rl_wheel_pos = transform.map(QPointF(-wheel_offset_x, -wheel_offset_y))
-        rr_wheel_pos = transform.map(QPointF(-wheel_offset_x, wheel_offset_y))
-        
-        # Add wheels
-        for wheel_pos in [fl_wheel_pos, fr_wheel_pos, rl_wheel_pos, rr_wheel_pos]:
+        for wx, wy in [(wheel_offset_x, -wheel_offset_y), (wheel_offset_x, wheel_offset_y),
+                       (-wheel_offset_x, -wheel_offset_y), (-wheel_offset_x, wheel_offset_y)]:
             wheel = self.scene.addEllipse(
-                wheel_pos.x()-wheel_size/2, wheel_pos.y()-wheel_size/2,
+                wx-wheel_size/2, wy-wheel_size/2,
                 wheel_size, wheel_size,
-                QPen(Qt.NoPen), QBrush(wheel_color)
+                no_pen, wheel_brush
             )
-            car_group.addToGroup(wheel)
+            self._car_group.addToGroup(wheel)
             
-        # Add a windshield
+        # Windshield
         windshield_path = QPainterPath()
         windshield_path.moveTo(length/6, 0)
         windshield_path.lineTo(0, -width/3)
         windshield_path.lineTo(0, width/3)
         windshield_path.lineTo(length/6, 0)
-        windshield_path = transform.map(windshield_path)
         
-        windshield = self.scene.addPath(
-            windshield_path, QPen(Qt.NoPen), 
-            QBrush(QColor(150, 230, 255) if not in_collision else QColor(255, 200, 200))
+        self._car_windshield_item = self.scene.addPath(windshield_path, no_pen, self._windshield_brush)
+        self._car_group.addToGroup(self._car_windshield_item)
+        
+        # Collision effect (shown while colliding)
+        explosion_radius = 20.0
+        self._car_explosion_item = self.scene.addEllipse(
+            -explosion_radius, -explosion_radius,
+            explosion_radius*2, explosion_radius*2,
+            QPen(QColor(255, 100, 30, 150), 2),
+            QBrush(QColor(255, 140, 50, 100))
         )
-        car_group.addToGroup(windshield)
-            
-        # If collision occurred, add effect
-        if in_collision:
-            explosion_radius = 20.0
-            explosion = self.scene.addEllipse(
-                pos[0]-explosion_radius, pos[1]-explosion_radius,
-                explosion_radius*2, explosion_radius*2,
-                QPen(QColor(255, 100, 30, 150), 2),
-                QBrush(QColor(255, 140, 50, 100))
+        self._car_group.addToGroup(self._car_explosion_item)
+        self._car_group.setVisible(False)
+        
+        # Frames only translate the car, so let Qt reuse the rasterized parts
+        for part in self._car_group.childItems():
+            part.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
+    def _pooled_items(self, pool, count: int, factory=None, z: float = 0):
+        """Grow an item pool to count items, hide the surplus and return the used ones"""
+        while len(pool) < count:
+            item = factory()
+            item.setZValue(z)
+            pool.append(item)
+        for i, item in enumerate(pool):
+            item.setVisible(i < count)
+        return pool[:count]
+        
+    def _redraw(self):
+        """Update the persistent scene items to match the current state"""
+        has_path = bool(self.path_start and self.path_end)
+        
+        # Draw hull
+        self._hull_item.setVisible(len(self.hull) >= 3)
+        self._hull_line_item.setVisible(len(self.hull) == 2)
+        if len(self.hull) >= 3:
+            self._hull_item.setPolygon(QPolygonF([QPointF(x, y) for x, y in self._hull_pts]))
+            self._hull_item.setPen(self.scene.hull_pen)
+            self._hull_item.setBrush(self.scene.hull_brush)
+        elif len(self.hull) == 2:
+            p1, p2 = self.hull
+            self._hull_line_item.setLine(p1[0], p1[1], p2[0], p2[1])
+            self._hull_line_item.setPen(self.scene.hull_pen)
+            
+        # Draw obstacle points (points are only appended or cleared, so the
+        # path only needs rebuilding when the count changes)
+        if self._dots_count != self._n_points:
+            dots_path = QPainterPath()
+            dots_path.setFillRule(Qt.WindingFill)  # overlapping dots stay filled
+            for x, y in self.points.tolist():
+                dots_path.addEllipse(x-4, y-4, 8, 8)
+            self._dots_item.setPath(dots_path)
+            self._dots_count = self._n_points
+        self._dots_item.setBrush(self.scene.obstacle_brush)
+            
+        # Draw path
+        self._path_item.setVisible(has_path)
+        self._start_item.setVisible(has_path)
+        self._end_item.setVisible(has_path)
+        if has_path:
+            self._path_item.setLine(
+                self.path_start[0], self.path_start[1],
+                self.path_end[0], self.path_end[1]
             )
-            car_group.addToGroup(explosion)
+            self._start_item.setPos(*self.path_start)
+            self._end_item.setPos(*self.path_end)
+            
+        # Draw collisions
+        collision_items = self._pooled_items(
+            self._collision_items, len(self.collisions),
+            lambda: self.scene.addEllipse(-7, -7, 14, 14, self.scene.collision_pen, self._no_brush),
+            z=40
+        )
+        for collision_item, (x, y) in zip(collision_items, self.collisions):
+            collision_item.setPos(x, y)
+            
+        # Highlight first collision
+        show_first = self.first_collision_t is not None and has_path
+        self._first_collision_item.setVisible(show_first)
+        if show_first:
+            cx, cy = self._point_at_t(self.first_collision_t)
+            self._first_collision_item.setPos(cx, cy)
+            self._glow_item.setPos(cx, cy)
+            
+        self._redraw_motion()
+            
+    def _redraw_motion(self):
+        """Update only the items that move with the car (trail, car, glow)"""
+        has_path = bool(self.path_start and self.path_end)
+        
+        # Draw motion trail if enabled
+        trail = self.trail_points if has_path and self.show_motion_trail else ()
+        # The newest point always uses the last (largest, brightest) slot
+        offset = len(self._trail_items) - len(trail)
+        for i, trail_item in enumerate(self._trail_items):
+            trail_item.setVisible(i >= offset)
+        for trail_item, (x, y) in zip(self._trail_items[offset:], trail):
+            trail_item.setPos(x, y)
+            
+        # Draw car
+        self._draw_car()
+        
+        # Add a pulsing effect
+        self._glow_item.setVisible(
+            has_path and self.first_collision_t is not None
+            and self.anim_running and self.car_t >= self.first_collision_t
+        )
+            
+    def _draw_car(self):
+        """Move the car to the current position along the path"""
+        if not self.path_start or not self.path_end:
+            self._car_group.setVisible(False)
+            return
             
+        # Called every frame, so read the path cache directly
+        sx, sy, dx, dy = self._path_cache[:4]
+        if dx == 0 and dy == 0:
+            self._car_group.setVisible(False)
+            return
+        t = self.car_t
+        pos = (sx + dx * t, sy + dy * t)
+            
+        # Check if car is in collision state
+        in_collision = (self.first_collision_t is not None and 
+                       self.car_t >= self.first_collision_t - 1e-6)
+        
+        # Add to trail (the deque drops the oldest point)
+        self.trail_points.append(pos)
+            
+        # Car color changes on collision
+        self._car_body_item.setBrush(self._car_body_hit_brush if in_collision else self._car_body_brush)
+        self._car_highlight_item.setVisible(not in_collision)
+        self._car_windshield_item.setBrush(self._windshield_hit_brush if in_collision else self._windshield_brush)
+        self._car_explosion_item.setVisible(in_collision)
+        
+        # Place the car in world space
+        self._car_group.setPos(pos[0], pos[1])
+        self._car_group.setVisible(True)
+        
     def _clear_path(self):
         """Clear the path"""
         self.path_start = None
         self.path_end = None
+        self._refresh_path_cache()
         self.collisions.clear()
+        self._collision_key = None
         self.trail_points.clear()
         
         # Stop animation
@@ -707,8 +850,8 @@ class CollisionDetectorApp(QMainWindow):
         
     def _clear_all(self):
         """Clear everything"""
-        self.points.clear()
-        self.hull.clear()
+        self._n_points = 0
+        self._set_hull(np.empty(0, dtype=np.intp))
         self._clear_path()
         
     def _start_animation(self):
@@ -721,13 +864,14 @@ class CollisionDetectorApp(QMainWindow):
             self.trail_points.clear()
             
         self.anim_running = True
-        self._last_ts = time.perf_counter()
-        self._tick()
+        self._anim_clock.start()
+        self._anim_timer.start()
         
     def _pause_animation(self):
         """Pause the car animation"""
         self.anim_running = False
-        self._last_ts = None
+        self._anim_clock.invalidate()
+        self._anim_timer.stop()
         
     def _reset_animation(self):
         """Reset car to start position"""
@@ -740,26 +884,26 @@ class CollisionDetectorApp(QMainWindow):
     def _tick(self):
         """Animation tick handler"""
         if not self.anim_running or not (self.path_start and self.path_end):
+            self._pause_animation()
             return
             
-        now = time.perf_counter()
-        dt = (now - self._last_ts) if self._last_ts else 0.0
-        self._last_ts = now
+        dt = self._anim_clock.nsecsElapsed() * 1e-9
+        self._anim_clock.restart()
         
-        L = self._path_length()
-        if L <= 1e-9:
+        inv_len = self._path_cache[5]
+        if not inv_len:
             self._pause_animation()
             return
             
         # Advance car position
-        step_t = (self.speed_slider.value() * dt) / L
+        step_t = self.speed_slider.value() * dt * inv_len
         target_t = self.car_t + step_t
         
         # Check for collision
         if self.stop_on_collision.isChecked() and self.first_collision_t is not None:
             if target_t >= self.first_collision_t:
                 self.car_t = self.first_collision_t
-                self._redraw()
+                self._redraw_motion()
                 self._refresh_info()
                 self._pause_animation()
                 return
@@ -767,48 +911,64 @@ class CollisionDetectorApp(QMainWindow):
         # Update position
         self.car_t = min(target_t, 1.0)
         if self.car_t >= 1.0:
-            self._redraw()
+            self._redraw_motion()
             self._refresh_info()
             self._pause_animation()
             return
             
-        self._redraw()
+        self._redraw_motion()
         # Don't refresh info every frame for performance
         if dt > 0.1:
             self._refresh_info()
-            
-        # Continue animation
-        QTimer.singleShot(16, self._tick)  # ~60 FPS
         
     def _refresh_info(self):
         """Update info panel with current state"""
-        lines = [
-            f"<b>Obstacles:</b> {len(self.points)}",
-            f"<b>Hull vertices:</b> {len(self.hull)}",
-            f"<b>Path start:</b> {self._fmt(self.path_start)}",
-            f"<b>Path end:</b> {self._fmt(self.path_end)}",
-            f"<b>Start position:</b> {self._pos_str(self.path_start)}",
-            f"<b>End position:</b> {self._pos_str(self.path_end)}",
-            f"<b>Car t:</b> {self.car_t:.3f}" if self.path_start and self.path_end else "<b>Car t:</b> —",
-            "",
-            "<b>Collisions:</b>"
-        ]
+        # Nothing to show while the side panel is collapsed; catch up when it reopens
+        if self.isVisible() and self.info_text.visibleRegion().isEmpty():
+            self._info_dirty = True
+            return
+        self._info_dirty = False
         
-        if self.collisions:
-            lines.extend(f"• {self._fmt(p)}" for p in sorted(self.collisions, key=lambda p: (p[0], p[1])))
-            if self.first_collision_t is not None:
-                lines.append(f"<b>First collision at t={self.first_collision_t:.3f}</b>")
-        else:
-            lines.append("• None")
+        # Everything shown derives from these; skip the setHtml reparse when unchanged
+        key = (
+            self._n_points, self._hull_rev, self.path_start, self.path_end,
+            self.hit_tol, self._collision_key,
+        )
+        has_path = bool(self.path_start and self.path_end)
+        car_line = f"<b>Car t:</b> {self.car_t:.3f}" if has_path else "<b>Car t:</b> —"
+        if key == self._info_key and car_line == self._info_car_line:
+            return
+        self._info_car_line = car_line
+        
+        # While animating only the car line changes; rebuild the rest on demand
+        if key != self._info_key:
+            self._info_key = key
+            self._info_head = "<br>".join([
+                f"<b>Obstacles:</b> {len(self.points)}",
+                f"<b>Hull vertices:</b> {len(self.hull)}",
+                f"<b>Path start:</b> {self._fmt(self.path_start)}",
+                f"<b>Path end:</b> {self._fmt(self.path_end)}",
+                f"<b>Start position:</b> {self._pos_str(self.path_start)}",
+                f"<b>End position:</b> {self._pos_str(self.path_end)}",
+            ])
+            if self.collisions:
+                tail = "<br>".join(f"• ({x:.1f}, {y:.1f})" for x, y in self.collisions)
+                if self.first_collision_t is not None:
+                    tail += f"<br><b>First collision at t={self.first_collision_t:.3f}</b>"
+            else:
+                tail = "• None"
+            self._info_tail = tail
             
-        self.info_text.setHtml("<p>" + "<br>".join(lines) + "</p>")
+            # Update path status
+            if has_path:
+                self.path_status.setText(f"Path: {self._fmt_short(self.path_start)} → {self._fmt_short(self.path_end)}")
+            else:
+                self.path_status.setText("No path")
+                
+        self.info_text.setHtml(
+            f"<p>{self._info_head}<br>{car_line}<br><br><b>Collisions:</b><br>{self._info_tail}</p>"
+        )
         
-        # Update path status
-        if self.path_start and self.path_end:
-            self.path_status.setText(f"Path: {self._fmt_short(self.path_start)} → {self._fmt_short(self.path_end)}")
-        else:
-            self.path_status.setText("No path")
-            
     def keyPressEvent(self, event):
         """Handle key press events"""
         if event.key() == self.shortcut_play:  # Space
@@ -822,78 +982,60 @@ class CollisionDetectorApp(QMainWindow):
             super().keyPressEvent(event)
         
     # Geometric helpers
-    def _path_vector(self) -> Tuple[float, float]:
-        """Get the path vector"""
-        if not (self.path_start and self.path_end):
-            return (0.0, 0.0)
-        return (self.path_end[0] - self.path_start[0], self.path_end[1] - self.path_start[1])
-        
+    def _refresh_path_cache(self):
+        """Cache (sx, sy, dx, dy, length, 1/length) of the path after an endpoint changes"""
+        if self.path_start and self.path_end:
+            sx, sy = self.path_start
+            dx, dy = self.path_end[0] - sx, self.path_end[1] - sy
+            L = math.hypot(dx, dy)
+            self._path_cache = (sx, sy, dx, dy, L, 1.0 / L if L > 1e-9 else 0.0)
+            if dx or dy:
+                # The path is straight, so the car heading only changes here
+                self._car_group.setRotation(math.degrees(math.atan2(dy, dx)))
+        else:
+            self._path_cache = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            
     def _path_length(self) -> float:
-        """Calculate path length"""
-        dx, dy = self._path_vector()
-        return math.hypot(dx, dy)
+        """Get the path length"""
+        return self._path_cache[4]
         
     def _point_at_t(self, t: float) -> Point:
         """Get point along path at parameter t"""
-        if not (self.path_start and self.path_end):
-            return (0.0, 0.0)
-        x0, y0 = self.path_start
-        dx, dy = self._path_vector()
-        return (x0 + dx * t, y0 + dy * t)
-        
-    def _compute_first_collision_t(self, hits: List[Point]) -> Optional[float]:
-        """Find the earliest collision along the path"""
-        if not (self.path_start and self.path_end) or not hits:
-            return None
-            
-        x0, y0 = self.path_start
-        dx, dy = self._path_vector()
-        L2 = dx * dx + dy * dy
-        
-        if L2 <= 1e-12:
-            return None
-            
-        best: Optional[float] = None
-        for hx, hy in hits:
-            t = ((hx - x0) * dx + (hy - y0) * dy) / L2
-            if 0.0 <= t <= 1.0:
-                best = t if best is None or t < best else best
-                
-        return best
+        sx, sy, dx, dy = self._path_cache[:4]
+        return (sx + dx * t, sy + dy * t)
         
     def _point_in_convex_hull(self, p: Optional[Point], eps: float = 1e-9) -> Optional[str]:
         """Check if point is inside/on/outside the hull"""
         if p is None or len(self.hull) == 0:
             return None
             
-        if len(self.hull) == 1:
-            return "on boundary" if math.hypot(p[0] - self.hull[0][0], p[1] - self.hull[0][1]) <= eps else "outside"
+        # Nothing farther than the tolerance from the hull's box can touch it
+        tol = max(eps, self.hit_tol)
+        xmin, ymin, xmax, ymax = self._hull_bbox
+        if p[0] < xmin - tol or p[0] > xmax + tol or p[1] < ymin - tol or p[1] > ymax + tol:
+            return "outside"
             
-        if len(self.hull) == 2:
-            return "on boundary" if self._point_on_segment(self.hull[0], self.hull[1], p, eps) else "outside"
-            
-        on_boundary = False
-        n = len(self.hull)
+        hull = self._hull_pts
         
-        for i in range(n):
-            a = self.hull[i]
-            b = self.hull[(i + 1) % n]
+        if len(hull) == 1:
+            dx, dy = p[0] - hull[0][0], p[1] - hull[0][1]
+            return "on boundary" if dx * dx + dy * dy <= eps * eps else "outside"
             
-            # Check if on boundary
-            if self._point_on_segment(a, b, p, max(eps, self.hit_tol)):
-                on_boundary = True
-                continue
-                
-            # Check if inside (CCW hull => cross >= -eps)
-            if self._cross(b[0] - a[0], b[1] - a[1], p[0] - a[0], p[1] - a[1]) < -eps:
-                return "outside"
-                
-        return "on boundary" if on_boundary else "inside"
-    
-    @staticmethod
-    def _cross(ax: float, ay: float, bx: float, by: float) -> float:
-        """2D cross product"""
-        return ax * by - ay * bx
+        if len(hull) == 2:
+            return "on boundary" if self._point_on_segment(hull[0], hull[1], p, eps) else "outside"
+            
+        # O(log h) wedge search for inside/outside; one vectorized distance pass
+        # over the cached edge arrays settles the tolerance band
+        ea, eb = self._edges_a, self._edges_b
+        near = point_segment_sq_distances(np.array([p], dtype=np.float64), ea, eb)[0] <= tol * tol
+        if in_convex_hull(hull, p, eps):
+            return "on boundary" if near.any() else "inside"
+        if not near.any():
+            return "outside"
+            
+        # Just outside: on the boundary only if every edge excluding p is near it
+        cross = (eb[:, 0] - ea[:, 0]) * (p[1] - ea[:, 1]) - (eb[:, 1] - ea[:, 1]) * (p[0] - ea[:, 0])
+        return "outside" if ((cross < -eps) & ~near).any() else "on boundary"
     
     def _point_on_segment(self, a: Point, b: Point, p: Point, eps: float) -> bool:
         """Check if point is on segment with tolerance"""
@@ -903,12 +1045,14 @@ class CollisionDetectorApp(QMainWindow):
         
         ab2 = abx * abx + aby * aby
         if ab2 == 0.0:
-            return math.hypot(px - ax, py - ay) <= eps
+            return apx * apx + apy * apy <= eps * eps
             
-        t = max(0.0, min(1.0, (apx * abx + apy * aby) / ab2))
-        qx, qy = ax + t * abx, ay + t * aby
+        # Clamp to [0, 1] as relu(u) - relu(u - 1); compare squared distances
+        u = (apx * abx + apy * aby) / ab2
+        t = (u if u > 0.0 else 0.0) - (u - 1.0 if u > 1.0 else 0.0)
+        dx, dy = apx - t * abx, apy - t * aby
         
-        return math.hypot(px - qx, py - qy) <= eps
+        return dx * dx + dy * dy <= eps * eps
     
     def _pos_str(self, p: Optional[Point]) -> str:
         """Get position description"""
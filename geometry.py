@@ -1,28 +1,157 @@
-from typing import Iterable, List, Optional, Sequence, Tuple
+# The numpy kernels stay in float64. Hulls hold tens of edges, so float32
+# would save no measurable bandwidth, while the fixed 1e-9 collinearity and
+# parameter tolerances below (and the exact fallback in orient2d) assume
+# double precision.
+
+from fractions import Fraction
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 Point = Tuple[float, float]
 Segment = Tuple[Point, Point]
 
 
-def _cross(o: Point, a: Point, b: Point) -> float:
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+# Shewchuk's bound on the rounding error of the float orientation determinant
+_CCW_ERRBOUND_A = (3.0 + 16.0 * 2.0 ** -53) * 2.0 ** -53
+
+
+def orient2d(a: Point, b: Point, c: Point) -> float:
+    # Twice the signed area of a, b, c (> 0 when counter-clockwise). The float
+    # estimate is returned when its sign is provably right; otherwise the
+    # determinant is recomputed exactly.
+    detleft = (a[0] - c[0]) * (b[1] - c[1])
+    detright = (a[1] - c[1]) * (b[0] - c[0])
+    det = detleft - detright
+    if abs(det) >= _CCW_ERRBOUND_A * (abs(detleft) + abs(detright)):
+        return det
+    ax, ay, bx, by, cx, cy = map(Fraction, (a[0], a[1], b[0], b[1], c[0], c[1]))
+    return float((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+# below this many points, sorting plain tuples beats np.unique's fixed cost
+_SMALL_HULL = 256
+
+
+def convex_hull(points: Union[np.ndarray, Iterable[Point]]) -> List[Point]:
+    # an (n, 2) array is used as is rather than iterated row by row
+    if not isinstance(points, np.ndarray):
+        points = list(points)
+        if len(points) < _SMALL_HULL:
+            pts = sorted({(float(x), float(y)) for x, y in points})
+            xs = [p[0] for p in pts]
+            ys = [p[1] for p in pts]
+            return [pts[k] for k in _monotone_chain(xs, ys)]
+    xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return [tuple(p) for p in xy[convex_hull_indices(xy)].tolist()]
+
+
+def _akl_toussaint(xy: np.ndarray) -> np.ndarray:
+    # indices of the points not strictly inside the quadrilateral spanned by
+    # the leftmost, lowest, rightmost and highest points (none of those can
+    # be hull vertices); points on its edges are kept. Only large batch
+    # builds reach it; incremental inserts never rebuild from raw points
+    x, y = xy[:, 0], xy[:, 1]
+    quad = xy[[np.argmin(x), np.argmin(y), np.argmax(x), np.argmax(y)]]
+    inside = np.ones(len(xy), dtype=bool)
+    for (ax, ay), (bx, by) in zip(quad, np.roll(quad, -1, axis=0)):
+        inside &= (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0
+    return np.flatnonzero(~inside)
+
+
+def convex_hull_indices(xy: np.ndarray) -> np.ndarray:
+    if len(xy) < _SMALL_HULL:
+        # first index of each distinct point, in lexicographic order
+        first: dict = {}
+        for k, p in enumerate(map(tuple, xy.tolist())):
+            first.setdefault(p, k)
+        pts = sorted(first)
+        order = np.array([first[p] for p in pts], dtype=np.intp)
+        xs = [p[0] for p in pts]
+        ys = [p[1] for p in pts]
+    else:
+        keep = _akl_toussaint(xy)
+        # np.unique sorts rows lexicographically and drops duplicates
+        _, order = np.unique(xy[keep], axis=0, return_index=True)
+        order = keep[order]
+        xs, ys = xy[order].T.tolist()
+    return order[_monotone_chain(xs, ys)]
+
+
+def _monotone_chain(xs: List[float], ys: List[float]) -> List[int]:
+    # positions of the CCW hull vertices among distinct, lexicographically
+    # sorted points
+    n = len(xs)
+    if n <= 1:
+        return list(range(n))
+    # Andrew's monotone chain on one preallocated index stack: the lower
+    # chain first, then the upper chain on top of it (never popping below
+    # `floor`); the cross product is inlined on plain floats
+    stack = [0] * (2 * n)
+    top = 0
+    for k in range(n):
+        xk, yk = xs[k], ys[k]
+        while top >= 2:
+            o, a = stack[top - 2], stack[top - 1]
+            if (xs[a] - xs[o]) * (yk - ys[o]) - (ys[a] - ys[o]) * (xk - xs[o]) > 0:
+                break
+            top -= 1
+        stack[top] = k
+        top += 1
+    floor = top + 1
+    for k in range(n - 2, -1, -1):
+        xk, yk = xs[k], ys[k]
+        while top >= floor:
+            o, a = stack[top - 2], stack[top - 1]
+            if (xs[a] - xs[o]) * (yk - ys[o]) - (ys[a] - ys[o]) * (xk - xs[o]) > 0:
+                break
+            top -= 1
+        stack[top] = k
+        top += 1
+    return stack[:top - 1]
+
+
+def hull_insert(xy: np.ndarray, hull_idx: np.ndarray, i: int) -> np.ndarray:
+    # Splice point i into a CCW hull given as indices into xy: drop the run of
+    # edges it can see and join their end vertices (the tangents) through it.
+    # Returns hull_idx itself when the point is already inside.
+    if len(hull_idx) < 3:
+        candidates = np.append(hull_idx, i)
+        return candidates[convex_hull_indices(xy[candidates])]
+    a = xy[hull_idx]
+    d = np.roll(a, -1, axis=0) - a
+    px, py = xy[i]
+    cross = d[:, 0] * (py - a[:, 1]) - d[:, 1] * (px - a[:, 0])
+    if (cross >= 0).all():
+        return hull_idx
+    # edge k runs hull_idx[k] -> hull_idx[k + 1]; rotate so a hidden edge comes
+    # last and the visible run (collinear edges included) cannot wrap around
+    shift = int(np.argmin(cross <= 0)) + 1
+    visible = np.roll(cross <= 0, -shift)
+    idx = np.roll(hull_idx, -shift)
+    first = int(np.argmax(visible))
+    last = first + int(visible.sum())
+    return np.concatenate((idx[:first + 1], [i], idx[last:]))
+
 
+def in_convex_hull(hull: Sequence[Point], p: Point, eps: float = 1e-9) -> bool:
+    # O(log h) wedge test against a CCW hull of >= 3 vertices: binary search
+    # the fan of rays from hull[0], then check p against the chord it lands on
+    n = len(hull)
 
-def convex_hull(points: Iterable[Point]) -> List[Point]:
-    pts = sorted(set(points))
-    if len(pts) <= 1:
-        return pts
-    lower: List[Point] = []
-    for p in pts:
-        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
-            lower.pop()
-        lower.append(p)
-    upper: List[Point] = []
-    for p in reversed(pts):
-        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
-            upper.pop()
-        upper.append(p)
-    return lower[:-1] + upper[:-1]
+    def side(k: int) -> float:
+        return orient2d(hull[0], hull[k], p)
+
+    if side(1) < -eps or side(n - 1) > eps:
+        return False
+    lo, hi = 1, n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if side(mid) >= 0:
+            lo = mid
+        else:
+            hi = mid
+    return orient2d(hull[lo], hull[lo + 1], p) >= -eps
 
 
 def _on_segment(a: Point, b: Point, c: Point) -> bool:
@@ -32,25 +161,21 @@ def _on_segment(a: Point, b: Point, c: Point) -> bool:
     )
 
 
-def _orientation(a: Point, b: Point, c: Point) -> float:
-    return _cross(a, b, c)
-
-
 def segments_intersect(s1: Segment, s2: Segment) -> bool:
     (p1, p2), (q1, q2) = s1, s2
-    o1 = _orientation(p1, p2, q1)
-    o2 = _orientation(p1, p2, q2)
-    o3 = _orientation(q1, q2, p1)
-    o4 = _orientation(q1, q2, p2)
+    o1 = orient2d(p1, p2, q1)
+    o2 = orient2d(p1, p2, q2)
+    o3 = orient2d(q1, q2, p1)
+    o4 = orient2d(q1, q2, p2)
     if (o1 * o2 < 0) and (o3 * o4 < 0):
         return True
-    if abs(o1) < 1e-9 and _on_segment(p1, p2, q1):
+    if o1 == 0 and _on_segment(p1, p2, q1):
         return True
-    if abs(o2) < 1e-9 and _on_segment(p1, p2, q2):
+    if o2 == 0 and _on_segment(p1, p2, q2):
         return True
-    if abs(o3) < 1e-9 and _on_segment(q1, q2, p1):
+    if o3 == 0 and _on_segment(q1, q2, p1):
         return True
-    if abs(o4) < 1e-9 and _on_segment(q1, q2, p2):
+    if o4 == 0 and _on_segment(q1, q2, p2):
         return True
     return False
 
@@ -84,3 +209,99 @@ def hull_edges(hull: Sequence[Point]) -> List[Segment]:
     if len(hull) == 2:
         return [(hull[0], hull[1])]
     return [(hull[i], hull[(i + 1) % len(hull)]) for i in range(len(hull))]
+
+
+def point_segment_sq_distances(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # (k, 2) points against (e, 2) segments a->b, giving a (k, e) matrix of
+    # squared distances (compare against tol ** 2; no square roots needed)
+    d = b - a
+    ap = p[:, None, :] - a[None, :, :]
+    ab2 = np.einsum("ij,ij->i", d, d)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(ab2 > 0.0, np.einsum("pij,ij->pi", ap, d) / ab2, 0.0)
+    s = np.clip(s, 0.0, 1.0)
+    r = ap - s[..., None] * d
+    return np.einsum("pij,pij->pi", r, r)
+
+
+def hull_edge_arrays(hull_xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # hull edges as contiguous (e, 2) start/end arrays; a 2-vertex hull is one edge
+    a = np.ascontiguousarray(hull_xy, dtype=np.float64)
+    if len(a) < 2:
+        return a[:0], a[:0]
+    b = np.roll(a, -1, axis=0)
+    if len(a) == 2:
+        a, b = a[:1], b[:1]
+    return a, b
+
+
+def path_edge_intersections(
+    start: np.ndarray, end: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    # intersection_point for the path start->end against every edge a->b in
+    # one broadcast; returns the hit points and their path parameters t
+    d1 = b - a
+    d2 = end - start
+    w = a - start
+
+    denom = d2[0] * d1[:, 1] - d2[1] * d1[:, 0]
+    w_x_d1 = w[:, 0] * d1[:, 1] - w[:, 1] * d1[:, 0]
+    w_x_d2 = w[:, 0] * d2[1] - w[:, 1] * d2[0]
+    crossing = np.abs(denom) > 1e-9
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(crossing, w_x_d1 / denom, -1.0)
+        u = np.where(crossing, w_x_d2 / denom, -1.0)
+    hit = crossing & (t >= -1e-9) & (t <= 1 + 1e-9) & (u >= -1e-9) & (u <= 1 + 1e-9)
+    found = [start + t[hit, None] * d2]
+    found_t = [t[hit]]
+
+    # collinear overlap: report the edge endpoints lying on the path
+    l2 = float(d2 @ d2)
+    collinear = ~crossing & (np.abs(w_x_d2) < 1e-9)
+    if l2 > 0.0 and collinear.any():
+        c = np.vstack((a[collinear], b[collinear]))
+        tc = ((c - start) @ d2) / l2
+        on_path = (tc >= -1e-9) & (tc <= 1 + 1e-9)
+        found.append(c[on_path])
+        found_t.append(tc[on_path])
+    return np.vstack(found), np.concatenate(found_t)
+
+
+def collisions_against_hull(
+    a: np.ndarray, b: np.ndarray, start: np.ndarray, end: np.ndarray, tol: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    # a, b: hull edges as returned by hull_edge_arrays
+    empty = np.empty((0, 2), dtype=np.float64), np.empty(0, dtype=np.float64)
+    if len(a) == 0:
+        return empty
+
+    # broad phase: every hit lies within tol of both the path and the hull
+    margin = tol + 1e-9
+    lo = np.minimum(start, end) - margin
+    hi = np.maximum(start, end) + margin
+    emin = np.minimum(a, b)
+    emax = np.maximum(a, b)
+    if (emin.min(axis=0) > hi).any() or (emax.max(axis=0) < lo).any():
+        return empty
+    near = ((emin <= hi) & (emax >= lo)).all(axis=1)
+    if not near.any():
+        return empty
+    a, b = a[near], b[near]
+
+    pts, ts = path_edge_intersections(start, end, a, b)
+
+    # path endpoints within tol of an edge
+    p = np.stack((start, end))
+    close = (point_segment_sq_distances(p, a, b) <= tol * tol).any(axis=1)
+    pts = np.vstack((pts, p[close]))
+    ts = np.clip(np.concatenate((ts, np.array([0.0, 1.0])[close])), 0.0, 1.0)
+    if len(pts) == 0:
+        return pts, ts
+    # dedupe on a 1e-6 grid, keeping first occurrences in order
+    seen = set()
+    idx = []
+    for k, key in enumerate(map(tuple, np.round(pts * 1e6).astype(np.int64).tolist())):
+        if key not in seen:
+            seen.add(key)
+            idx.append(k)
+    return pts[idx], ts[idx]